@@ -1,26 +1,16 @@
-from fastapi import Depends, Security
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import Request
 
-from src.auth.middleware import AuthMiddleware
 
+def get_current_user(request: Request):
+    """Dependency for endpoints that need the authenticated user.
 
-auth_middleware = AuthMiddleware()
-
-security = HTTPBearer()
-
-
-def get_current_user(credentials: HTTPAuthorizationCredentials = Security(security)):
-    """Dependency for authenticated endpoints.
+    The token is parsed and validated once by ``AuthMiddleware``; this only
+    reads the result it stored on the request state.
     
     Args:
-        credentials: The credentials extracted from the request by FastAPI
+        request: The incoming request
         
     Returns:
-        dict: Empty dict to satisfy dependency requirements
+        dict: Authenticated user data
     """
-    # usually returns actual authenticated user data
-    # but for now lets just return empty
-    return {}
-
-
-authenticated = Depends(auth_middleware)
\ No newline at end of file
+    return getattr(request.state, "user", {})
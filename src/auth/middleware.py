@@ -1,63 +1,180 @@
+import hashlib
+import json
 import logging
-from fastapi import HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from starlette.requests import Request
+from cachetools import TTLCache
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Security scheme for OpenAPI documentation
-auth_scheme = HTTPBearer()
+# validated tokens keyed by their SHA-256 digest so raw tokens are never kept in memory
+_token_cache = TTLCache(maxsize=settings.AUTH_CACHE_SIZE, ttl=settings.AUTH_CACHE_TTL)
+
+_MAX_TOKEN_LENGTH = 8192
+_MIN_JWT_LENGTH = 32
+
+
+def _unauthorized(detail: str) -> tuple:
+    """Build the raw ASGI headers and body of a 401 response once.
+
+    Args:
+        detail: Error message returned in the ``detail`` field
+
+    Returns:
+        tuple: (headers, body) ready to be sent over ASGI
+    """
+    body = json.dumps({"detail": detail}).encode()
+    headers = (
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    )
+    return headers, body
+
+
+# the only routes served without a token: the health check and the API docs
+_PUBLIC_PATHS = frozenset({"/", "/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json"})
+
+
+def _route_path(scope: Scope) -> str:
+    """Return the request path relative to the application root.
+
+    Mirrors Starlette's routing: ``scope["path"]`` includes ``root_path``
+    when the app runs behind a proxy with ``--root-path`` or is mounted as
+    a sub-application, while routes are matched without it.
+
+    Args:
+        scope: The ASGI connection scope
+
+    Returns:
+        str: The path the router will match
+    """
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        rest = path[len(root_path):]
+        if not rest:
+            return "/"
+        if rest[0] == "/":
+            return rest
+    return path
+
+
+# constant error responses, built at import time instead of on every failure
+_MISSING_HEADER = _unauthorized("Missing Authorization header")
+_INVALID_FORMAT = _unauthorized("Invalid Authorization header format. Use 'Bearer your_token'")
+_MALFORMED_TOKEN = _unauthorized("Malformed bearer token")
 
 
 class AuthMiddleware:
-    """Authentication middleware to validate bearer tokens."""
-    
-    async def __call__(self, request: Request):
+    """Pure ASGI authentication middleware to validate bearer tokens.
+
+    The Authorization header is read straight from the raw ``scope["headers"]``
+    list, so no Request/Headers objects are built for authenticated requests.
+    Every path is authenticated except the ``public_paths`` allowlist, so a
+    new router can not be left open by accident.
+    """
+
+    def __init__(self, app: ASGIApp, public_paths: frozenset = _PUBLIC_PATHS):
+        self.app = app
+        self.public_paths = public_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """Validate the authorization header.
-        
+
         Args:
-            request: The incoming request
-            
-        Raises:
-            HTTPException: If no valid token is provided
-            
-        Returns:
-            dict: Empty dict to satisfy dependency requirements
+            scope: The ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
+        if scope["type"] != "http" or _route_path(scope) in self.public_paths:
+            await self.app(scope, receive, send)
+            return
+
         # Extract the Authorization header
-        auth_header = request.headers.get("Authorization")
-        
+        auth_header = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value
+                break
+
         if not auth_header:
             logger.warning("Missing Authorization header")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Missing Authorization header"
-            )
-        
+            await self._reject(send, _MISSING_HEADER)
+            return
+
         # Check if it's a valid Bearer token format
-        parts = auth_header.split()
-        
-        if len(parts) != 2 or parts[0].lower() != "bearer":
+        if auth_header[:7].lower() != b"bearer ":
             logger.warning("Invalid Authorization header format")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid Authorization header format. Use 'Bearer your_token'"
-            )
-        
-        # Get the token
-        token = parts[1]
-        
-        if not token:
-            logger.warning("Empty token provided")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Empty token provided"
-            )
-        
+            await self._reject(send, _INVALID_FORMAT)
+            return
+
+        # Get the token, an empty or space separated value is a format error
+        token = auth_header[7:].strip()
+
+        if not token or b" " in token:
+            logger.warning("Invalid Authorization header format")
+            await self._reject(send, _INVALID_FORMAT)
+            return
+
+        # reject tokens that can never be valid before hashing or validating them
+        if not self._is_well_formed(token):
+            logger.warning("Malformed bearer token")
+            await self._reject(send, _MALFORMED_TOKEN)
+            return
+
+        key = hashlib.sha256(token).digest()
+        user = _token_cache.get(key)
+        if user is None:
+            user = self._validate_token(token)
+            _token_cache[key] = user
+
+        # usually holds the authenticated user data, exposed as request.state.user
+        scope.setdefault("state", {})["user"] = user
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _is_well_formed(token: bytes) -> bool:
+        """Cheap structural check run before any validation work.
+
+        Args:
+            token: The raw token bytes from the Authorization header
+
+        Returns:
+            bool: False if the token can be rejected without validating it
+        """
+        if len(token) > _MAX_TOKEN_LENGTH:
+            return False
+        if settings.AUTH_REQUIRE_JWT:
+            # header.payload.signature
+            return len(token) >= _MIN_JWT_LENGTH and token.count(b".") == 2
+        return True
+
+    @staticmethod
+    def _validate_token(token: bytes) -> dict:
+        """Validate a bearer token that is not in the cache yet.
+
+        Args:
+            token: The raw token bytes from the Authorization header
+
+        Returns:
+            dict: Authenticated user data
+        """
         # For this task, we accept any non-empty token as valid
         # In a real application, this would validate the token against
         # a JWT secret, user database, etc.
-        logger.info(f"Request authenticated with token: {token[:5]}...")
-        
-        # Return an empty dict to satisfy dependency requirements
-        return {}
\ No newline at end of file
+        logger.info("Request authenticated with token: %s...", token[:5].decode("latin-1"))
+        return {}
+
+    @staticmethod
+    async def _reject(send: Send, response: tuple):
+        """Send a precomputed 401 response without calling the downstream app.
+
+        Args:
+            send: ASGI send callable
+            response: (headers, body) pair built by ``_unauthorized``
+        """
+        headers, body = response
+        await send({"type": "http.response.start", "status": 401, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -17,7 +17,32 @@ class Settings(BaseSettings):
     NY_LONGITUDE: float = -74.0060
     NY_POSTCODE: str = "10001"
 
+    # seconds GET responses for items stay in the response cache, and how many
+    # pages/items each worker keeps at most
+    ITEMS_LIST_CACHE_TTL: int = 30
+    ITEMS_LIST_CACHE_SIZE: int = 256
+    ITEM_CACHE_TTL: int = 60
+    ITEM_CACHE_SIZE: int = 10000
+
     ZIP_API_BASE_URL: str = "https://api.zippopotam.us/us"
+    # seconds zipcode lookups are cached, unknown postcodes are retried sooner
+    ZIP_CACHE_TTL: int = 86400
+    ZIP_NEGATIVE_CACHE_TTL: int = 300
+    ZIP_CACHE_SIZE: int = 10000
+
+    # origins allowed to call the API from a browser, e.g. CORS_ORIGINS='["https://app.example.com"]'
+    CORS_ORIGINS: tuple[str, ...] = ()
+
+    # seconds a validated bearer token is trusted before being checked again
+    AUTH_CACHE_TTL: int = 30
+    AUTH_CACHE_SIZE: int = 10000
+    # enable once tokens are real JWTs to reject anything not shaped like one
+    AUTH_REQUIRE_JWT: bool = False
+
+    # emitted events are delivered in batches of up to EVENT_BATCH_SIZE, waiting
+    # at most EVENT_FLUSH_INTERVAL seconds for a batch to fill
+    EVENT_FLUSH_INTERVAL: float = 0.05
+    EVENT_BATCH_SIZE: int = 1000
 
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
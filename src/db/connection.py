@@ -7,7 +7,7 @@ logger = logging.getLogger(__name__)
 
 def connect_to_database():
     """Connect to MongoDB database."""
-    logger.info(f"Connecting to MongoDB database: {settings.MONGODB_DB_NAME}")
+    logger.info("Connecting to MongoDB database: %s", settings.MONGODB_DB_NAME)
     try:
         connect(
             db=settings.MONGODB_DB_NAME,
@@ -16,7 +16,7 @@ def connect_to_database():
         )
         logger.info("Successfully connected to MongoDB")
     except Exception as e:
-        logger.error(f"Failed to connect to MongoDB: {str(e)}")
+        logger.error("Failed to connect to MongoDB: %s", e)
         raise
 
 
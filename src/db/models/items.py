@@ -1,4 +1,5 @@
 import datetime
+import time
 from enum import Enum
 from typing import List, Optional
 from mongoengine import (
@@ -6,6 +7,8 @@ from mongoengine import (
     DateTimeField, EnumField
 )
 
+from src.utils.validators import convert_keys_to_camel_case, seed_key_cache
+
 
 class Direction(str, Enum):
     """Enumeration of possible directions from New York."""
@@ -15,6 +18,14 @@ class Direction(str, Enum):
     SOUTHWEST = "SW"
 
 
+_UTC = datetime.timezone.utc
+
+
+def _utcnow() -> datetime.datetime:
+    """Current time as an aware UTC datetime, cheaper than ``datetime.now(tz)``."""
+    return datetime.datetime.fromtimestamp(time.time(), _UTC)
+
+
 class Item(Document):
     """Item model as defined in requirements."""
     name = StringField(required=True, max_length=50)
@@ -25,23 +36,26 @@ class Item(Document):
     title = StringField(max_length=100)
     users = ListField(StringField(max_length=50))
     start_date = DateTimeField(required=True)
-    created_at = DateTimeField(default=datetime.datetime.utcnow)
-    updated_at = DateTimeField(default=datetime.datetime.utcnow)
+    created_at = DateTimeField(default=_utcnow)
+    updated_at = DateTimeField(default=_utcnow)
     
     meta = {
         'collection': 'items',
+        # built in the background so index creation never blocks startup;
+        # postcode + created_at also serves created_at-ordered postcode queries
+        'index_background': True,
         'indexes': [
-            'name',
-            'postcode',
-            'created_at'
+            ('postcode', '-created_at'),
+            'name'
         ]
     }
     
     def save(self, *args, **kwargs):
         """Override save method to update timestamps."""
+        now = _utcnow()
         if not self.id:
-            self.created_at = datetime.datetime.now(datetime.UTC)
-        self.updated_at = datetime.datetime.now(datetime.UTC)
+            self.created_at = now
+        self.updated_at = now
         return super(Item, self).save(*args, **kwargs)
     
     def to_dict(self):
@@ -58,4 +72,61 @@ class Item(Document):
             "start_date": self.start_date,
             "created_at": self.created_at,
             "updated_at": self.updated_at
-        }
\ No newline at end of file
+        }
+    
+    def to_camel_dict(self):
+        """Convert document to dictionary with camelCase keys."""
+        return {CAMEL_KEYS[k]: v for k, v in self.to_dict().items()}
+    
+    @staticmethod
+    def raw_to_camel_dict(doc):
+        """Convert a raw pymongo document (from ``as_pymongo()``) to a camelCase dictionary.
+        
+        Produces the same shape as ``to_camel_dict`` without building an Item.
+        Fields that were never set are not stored by mongoengine, so they are
+        filled with the same defaults the document would have.
+        """
+        result = {camel: doc.get(snake) for snake, camel in _RAW_CAMEL_KEYS}
+        result["id"] = str(doc["_id"])
+        result["users"] = doc.get("users", [])
+        return result
+
+
+# snake_case field name -> camelCase API name, built once so converting a
+# document is a plain dict lookup per key
+CAMEL_KEYS = {
+    snake: camel
+    for camel, snake in convert_keys_to_camel_case({name: name for name in Item._fields}).items()
+}
+
+# request payloads use the same names, so warm the converters with them
+seed_key_cache(Item._fields)
+
+
+def _build_to_dict_fast():
+    """Generate a straight-line camelCase ``to_dict`` for the Item schema.
+
+    The body is produced once from ``Item._fields`` so it follows the
+    model, and reads each attribute directly instead of going through
+    ``to_dict`` and a key-renaming pass.
+    """
+    entries = []
+    for snake, camel in CAMEL_KEYS.items():
+        if snake == "id":
+            value = "str(self.id)"
+        elif isinstance(Item._fields[snake], ListField):
+            value = f"list(self.{snake})"
+        else:
+            value = f"self.{snake}"
+        entries.append(f"        {camel!r}: {value},")
+    source = "def to_dict_fast(self):\n    return {\n" + "\n".join(entries) + "\n    }\n"
+    namespace = {}
+    exec(compile(source, f"<{__name__}.Item.to_dict_fast>", "exec"), namespace)
+    to_dict_fast = namespace["to_dict_fast"]
+    to_dict_fast.__doc__ = "Same result as ``to_camel_dict``, generated for the known fields."
+    return to_dict_fast
+
+
+Item.to_dict_fast = _build_to_dict_fast()
+
+_RAW_CAMEL_KEYS = tuple((snake, camel) for snake, camel in CAMEL_KEYS.items() if snake != "id")
@@ -1,11 +1,24 @@
+import asyncio
+import inspect
 import logging
-from pyee import EventEmitter
-from typing import Any, Callable, Dict
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
-# global event emitter
-emitter = EventEmitter()
+# global listener registry: event name -> listeners in registration order
+_listeners: Dict[str, List[Callable]] = defaultdict(list)
+
+# background dispatcher state, set while the application is running
+_queue: Optional[asyncio.Queue] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker: Optional[asyncio.Task] = None
+
+# queued after the last event to tell the worker to stop
+_STOP = object()
+
+# out-of-band deliveries made without a dispatcher, referenced until done
+_pending: Set[asyncio.Task] = set()
 
 
 def init_event_listeners():
@@ -15,34 +28,213 @@ def init_event_listeners():
     # Listeners should be imported and registered here
 
 
+async def start_event_dispatcher(flush_interval: float = 0.05, max_batch: int = 1000):
+    """Start the background task that delivers emitted events in batches.
+
+    Must be called at app startup, from the loop serving requests.
+
+    Args:
+        flush_interval: Seconds to wait for more events once one is queued
+        max_batch: Maximum number of events delivered in one batch
+    """
+    global _queue, _loop, _worker
+    logger.info("Starting event dispatcher")
+    _loop = asyncio.get_running_loop()
+    _queue = asyncio.Queue()
+    _worker = _loop.create_task(_drain_events(_queue, flush_interval, max_batch))
+
+
+async def stop_event_dispatcher():
+    """Deliver every queued event and stop the background dispatcher."""
+    global _queue, _loop, _worker
+    if _worker is None:
+        return
+    logger.info("Stopping event dispatcher")
+    queue, worker = _queue, _worker
+    # events emitted from now on are delivered without the queue
+    _queue = _loop = _worker = None
+    queue.put_nowait(_STOP)
+    await worker
+
+    # events a threadpool worker queued behind the stop marker
+    leftovers = []
+    while not queue.empty():
+        leftovers.append(queue.get_nowait())
+    if leftovers:
+        await _publish_batch(leftovers)
+
+
 def emit_event(event_name: str, data: Dict[str, Any]):
     """Emit an event with data.
-    
+
+    While the dispatcher runs this only queues the event, so the caller
+    (usually a request handler) never waits on listeners. It is safe to call
+    from threadpool workers too. Without a dispatcher, delivery is scheduled
+    as a task on the running loop, or sync listeners are called immediately
+    when there is none.
+
+    Args:
+        event_name: The name of the event
+        data: Data to be passed to event listeners
+    """
+    logger.debug("Emitting event: %s with data: %s", event_name, data)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    # read once, the dispatcher may be stopped concurrently from the loop thread
+    queue, dispatcher_loop = _queue, _loop
+    if queue is not None and dispatcher_loop is not None:
+        if loop is dispatcher_loop:
+            queue.put_nowait((event_name, data))
+            return
+        try:
+            dispatcher_loop.call_soon_threadsafe(queue.put_nowait, (event_name, data))
+            return
+        except RuntimeError:
+            # the loop closed during shutdown, deliver in this thread instead
+            logger.warning("Event dispatcher loop is closed, delivering %s directly", event_name)
+            loop = None
+
+    if loop is not None:
+        task = loop.create_task(_publish_batch([(event_name, data)]))
+        _pending.add(task)
+        task.add_done_callback(_pending.discard)
+    else:
+        _dispatch(event_name, data)
+
+
+async def _drain_events(queue: asyncio.Queue, flush_interval: float, max_batch: int):
+    """Collect queued events into batches and deliver them until stopped.
+
+    A batch is delivered once ``max_batch`` events are collected or
+    ``flush_interval`` seconds passed since its first event.
+
+    Args:
+        queue: Queue the events are put on
+        flush_interval: Seconds to wait for more events once one is queued
+        max_batch: Maximum number of events delivered in one batch
+    """
+    stopping = False
+    while not stopping:
+        event = await queue.get()
+        if event is _STOP:
+            break
+
+        batch = [event]
+        try:
+            async with asyncio.timeout(flush_interval):
+                while len(batch) < max_batch:
+                    event = await queue.get()
+                    if event is _STOP:
+                        stopping = True
+                        break
+                    batch.append(event)
+        except TimeoutError:
+            pass
+
+        # a failed batch must not stop the worker, later events would pile up
+        try:
+            await _publish_batch(batch)
+        except Exception:
+            logger.exception("Failed to deliver a batch of %d events", len(batch))
+
+
+async def _publish_batch(batch: List[Tuple[str, Dict[str, Any]]]):
+    """Deliver a batch of events without blocking the event loop.
+
+    Sync listeners may do blocking work, so they run in a worker thread, in
+    the order the events were emitted. Async listeners run concurrently on
+    the loop. This is the single place to hand events to a bulk sink
+    (message broker, events collection, ...) instead of calling listeners
+    one by one.
+
+    Args:
+        batch: (event_name, data) pairs
+    """
+    await asyncio.to_thread(_dispatch_batch, batch)
+    await asyncio.gather(*(_dispatch_async(event_name, data) for event_name, data in batch))
+
+
+def _dispatch_batch(batch: List[Tuple[str, Dict[str, Any]]]):
+    """Call the sync listeners of every event in a batch.
+
+    Args:
+        batch: (event_name, data) pairs
+    """
+    for event_name, data in batch:
+        _dispatch(event_name, data)
+
+
+def _dispatch(event_name: str, data: Dict[str, Any]):
+    """Call every sync listener of an event.
+
+    A failing listener is logged and does not stop the remaining listeners.
+
+    Args:
+        event_name: The name of the event
+        data: Data to be passed to event listeners
+    """
+    for listener in _listeners.get(event_name, ()):
+        if inspect.iscoroutinefunction(listener):
+            continue
+        try:
+            listener(data)
+        except Exception:
+            logger.exception("Listener for event %s failed", event_name)
+
+
+async def _dispatch_async(event_name: str, data: Dict[str, Any]):
+    """Await every async listener of an event concurrently.
+
     Args:
         event_name: The name of the event
         data: Data to be passed to event listeners
     """
-    logger.debug(f"Emitting event: {event_name} with data: {data}")
-    emitter.emit(event_name, data)
+    listeners = [
+        listener for listener in _listeners.get(event_name, ())
+        if inspect.iscoroutinefunction(listener)
+    ]
+    if not listeners:
+        return
+    results = await asyncio.gather(*(listener(data) for listener in listeners), return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("Listener for event %s failed", event_name, exc_info=result)
+
+
+async def emit_async(event_name: str, data: Dict[str, Any]):
+    """Emit an event to async listeners concurrently.
+
+    Only coroutine function listeners are awaited; sync listeners of the
+    event are left to ``emit_event``.
+
+    Args:
+        event_name: The name of the event
+        data: Data to be passed to event listeners
+    """
+    logger.debug("Emitting async event: %s with data: %s", event_name, data)
+    await _dispatch_async(event_name, data)
 
 
 def register_listener(event_name: str, listener: Callable):
     """Register a listener for an event.
-    
+
     Args:
         event_name: The name of the event to listen for
         listener: The function to call when the event is emitted
     """
-    logger.debug(f"Registering listener for event: {event_name}")
-    emitter.on(event_name, listener)
+    logger.debug("Registering listener for event: %s", event_name)
+    _listeners[event_name].append(listener)
 
 
 def remove_listener(event_name: str, listener: Callable):
     """Remove a listener for an event.
-    
+
     Args:
         event_name: The name of the event
         listener: The function to remove
     """
-    logger.debug(f"Removing listener for event: {event_name}")
-    emitter.remove_listener(event_name, listener)
\ No newline at end of file
+    logger.debug("Removing listener for event: %s", event_name)
+    _listeners[event_name].remove(listener)
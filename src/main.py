@@ -1,14 +1,18 @@
 import logging
+import os
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
+from src.auth.middleware import AuthMiddleware
 from src.config import settings
 from src.db.connection import connect_to_database, disconnect_from_database
-from src.events import init_event_listeners
+from src.events import init_event_listeners, start_event_dispatcher, stop_event_dispatcher
+from src.middleware import LoggingMiddleware
 from src.routers.items.routes import router as items_router
 from src.routers.items.events import register_item_events
+from src.utils.geo import close_http_client
 
 from contextlib import asynccontextmanager
 
@@ -19,6 +23,7 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize application on startup."""
@@ -27,11 +32,14 @@ async def lifespan(app: FastAPI):
     connect_to_database()
     init_event_listeners()
     register_item_events()
+    await start_event_dispatcher(settings.EVENT_FLUSH_INTERVAL, settings.EVENT_BATCH_SIZE)
     logger.info("Application started successfully")
 
     yield
     
     logger.info("Application shutting down")
+    await stop_event_dispatcher()
+    await close_http_client()
     disconnect_from_database()   
     logger.info("Application shutdown complete")
 
@@ -42,24 +50,32 @@ app = FastAPI(
     description="A scalable and testable REST API for managing Items",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# authentication runs inside CORS so preflight requests are answered first
+app.add_middleware(AuthMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=settings.CORS_ORIGINS,
+    # bearer tokens are sent as a header, no cookies are involved
+    allow_credentials=False,
+    allow_methods=("GET", "POST", "PATCH", "DELETE"),
+    allow_headers=("Authorization", "Content-Type"),
 )
 
+# added last so it wraps every other middleware and times the full request
+app.add_middleware(LoggingMiddleware)
+
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler for unhandled exceptions."""
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"detail": "Internal server error"}
     )
@@ -76,6 +92,14 @@ async def read_root():
 app.include_router(items_router, prefix="/api/v1")
 
 
-
 if __name__ == "__main__":
-    uvicorn.run("src.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # uvloop and httptools are libuv / C based replacements for the asyncio loop and h11 parser
+    uvicorn.run(
+        "src.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+        log_level=settings.LOG_LEVEL.lower()
+    )
\ No newline at end of file
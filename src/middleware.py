@@ -1,49 +1,76 @@
 import logging
 import time
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from itertools import count
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
+# per-worker request counter, cheaper than formatting a timestamp and unique under concurrency
+_next_request_id = count(1).__next__
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging request and response information."""
-    
-    async def dispatch(self, request: Request, call_next):
+# health check endpoint hit by k8s/ecs probes
+_SKIP_PATHS = frozenset({"/"})
+
+
+class LoggingMiddleware:
+    """Pure ASGI middleware for logging request and response information.
+
+    Implemented without ``BaseHTTPMiddleware`` so requests are not wrapped
+    in an extra task group and no Request/Response objects are built. When
+    INFO logging is disabled requests pass straight through, without the
+    ``X-Process-Time`` header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """Process request and response for logging.
-        
+
         Args:
-            request: The incoming request
-            call_next: Function to call the next middleware/handler
-            
-        Returns:
-            Response: The response from the handler
+            scope: The ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
+        # nothing to do when INFO is muted, and the health check is polled by
+        # liveness probes so it would only add noise
+        if (
+            scope["type"] != "http"
+            or scope["path"] in _SKIP_PATHS
+            or not logger.isEnabledFor(logging.INFO)
+        ):
+            await self.app(scope, receive, send)
+            return
+
         # unique request ID
-        request_id = str(time.time())
-        
+        request_id = format(_next_request_id(), "x")
+        client = scope.get("client")
+
         logger.info(
-            f"Request [{request_id}]: {request.method} {request.url.path} "
-            f"(Client: {request.client.host if request.client else 'Unknown'})"
+            "Request [%s]: %s %s (Client: %s)",
+            request_id, scope["method"], scope["path"], client[0] if client else "Unknown"
         )
-        
+
         # Start timer
-        start_time = time.time()
-        
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                process_time = time.perf_counter() - start_time
+                logger.info(
+                    "Response [%s]: %s (Processed in %.4fs)",
+                    request_id, message["status"], process_time
+                )
+                headers = list(message.get("headers", []))
+                headers.append((b"x-process-time", f"{process_time:.4f}".encode()))
+                message["headers"] = headers
+            await send(message)
+
         try:
-            response = await call_next(request)
-            process_time = time.time() - start_time
-            logger.info(
-                f"Response [{request_id}]: {response.status_code} "
-                f"(Processed in {process_time:.4f}s)"
-            )
-            response.headers["X-Process-Time"] = f"{process_time:.4f}"
-            
-            return response
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
             logger.error(
-                f"Error [{request_id}]: {str(e)} "
-                f"(Processed in {time.time() - start_time:.4f}s)"
+                "Error [%s]: %s (Processed in %.4fs)",
+                request_id, e, time.perf_counter() - start_time
             )
-            raise
\ No newline at end of file
+            raise
@@ -20,7 +20,7 @@ def on_item_created(data: Dict[str, Any]):
         data: Event data including item_id
     """
     item_id = data.get("item_id")
-    logger.info(f"Item created event handler: {item_id}")
+    logger.info("Item created event handler: %s", item_id)
     # TODO
     # - Send a notification
     # - Trigger a workflow
@@ -33,7 +33,7 @@ def on_item_updated(data: Dict[str, Any]):
         data: Event data including item_id
     """
     item_id = data.get("item_id")
-    logger.info(f"Item updated event handler: {item_id}")
+    logger.info("Item updated event handler: %s", item_id)
     # TODO
     # - Update search indexes
     # - Notify subscribers
@@ -46,7 +46,7 @@ def on_item_deleted(data: Dict[str, Any]):
         data: Event data including item_id
     """
     item_id = data.get("item_id")
-    logger.info(f"Item deleted event handler: {item_id}")
+    logger.info("Item deleted event handler: %s", item_id)
     # TODO
     # - Clean up related resources
     # - Update caches
@@ -1,9 +1,14 @@
 import logging
-from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, Path, Body, status
-from fastapi.responses import JSONResponse
+from threading import Lock
+from typing import Callable, List, Dict, Any, Optional
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Body, Response, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
 
-from src.auth.dependencies import authenticated
+from src.config import settings
 from src.db.connection import get_db
 from src.routers.items.schemas import (
     ItemCreate, 
@@ -12,14 +17,76 @@ from src.routers.items.schemas import (
     ValidationError, 
     ErrorResponse
 )
-from src.routers.items.service import ItemService
+from src.routers.items.service import ItemService, parse_object_id
 
 logger = logging.getLogger(__name__)
 
+# Response caches hold the serialized JSON body, so a hit returns exactly the
+# bytes of the miss that filled it. They are per process: a write only
+# invalidates the worker that handled it, other workers may serve an entry
+# until its TTL runs out.
+_items_list_cache = TTLCache(maxsize=settings.ITEMS_LIST_CACHE_SIZE, ttl=settings.ITEMS_LIST_CACHE_TTL)
+_item_cache = TTLCache(maxsize=settings.ITEM_CACHE_SIZE, ttl=settings.ITEM_CACHE_TTL)
+# the read routes run in the threadpool
+_cache_lock = Lock()
+# bumped on every invalidation so a body built from data read before a write
+# is not stored after it
+_cache_generation = 0
+
+CACHE_STATUS_HEADER = "X-Cache"
+
+_ITEM_ADAPTER = TypeAdapter(ItemResponse)
+_ITEM_LIST_ADAPTER = TypeAdapter(List[ItemResponse])
+
+
+def _item_cache_key(item_id: str) -> str:
+    """Canonical cache key of an item, so every spelling of its ID shares one entry."""
+    oid = parse_object_id(item_id)
+    return str(oid) if oid is not None else item_id
+
+
+def _cached_json(cache: TTLCache, key: Any, build: Callable[[], bytes]) -> Response:
+    """Serve a JSON body from a response cache, building and storing it on a miss.
+    
+    Args:
+        cache: The response cache to use
+        key: Cache key of the response
+        build: Returns the serialized body, raises HTTPException for a
+            response that must not be cached
+        
+    Returns:
+        Response: The JSON response with the cache status header
+    """
+    with _cache_lock:
+        body = cache.get(key)
+        generation = _cache_generation
+    if body is not None:
+        return Response(body, media_type="application/json", headers={CACHE_STATUS_HEADER: "HIT"})
+    
+    body = build()
+    with _cache_lock:
+        if generation == _cache_generation:
+            cache[key] = body
+    return Response(body, media_type="application/json", headers={CACHE_STATUS_HEADER: "MISS"})
+
+
+def invalidate_item_cache(item_id: Optional[str] = None):
+    """Drop cached item listings and, if given, the cached item itself.
+    
+    Args:
+        item_id: ID of the item that changed
+    """
+    global _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        _items_list_cache.clear()
+        if item_id:
+            _item_cache.pop(_item_cache_key(item_id), None)
+
 router = APIRouter(
     prefix="/items",
     tags=["items"],
-    dependencies=[Depends(get_db), authenticated],
+    dependencies=[Depends(get_db)],
     responses={
         status.HTTP_401_UNAUTHORIZED: {"model": ErrorResponse},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ErrorResponse}
@@ -40,15 +107,18 @@ async def create_item(item: ItemCreate):
     """Create a new item."""
     logger.info("Request to create new item")
     
-    item_id, errors = await ItemService.create_item(item.model_dump())
+    # ItemCreate already enforced every rule validate_item_data checks
+    item_id, errors = await ItemService.create_item(item.model_dump(), validated=True)
     
     if errors:
-        logger.warning(f"Item creation failed due to validation errors: {errors}")
-        return JSONResponse(
+        logger.warning("Item creation failed due to validation errors: %s", errors)
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={"detail": errors}
         )
     
+    invalidate_item_cache()
+    
     return {"id": item_id}
 
 
@@ -59,13 +129,43 @@ async def create_item(item: ItemCreate):
         status.HTTP_200_OK: {"description": "List of items"}
     }
 )
-def get_items():
-    """Get all items."""
-    logger.info("Request to list all items")
+def get_items(
+    skip: int = Query(0, ge=0, description="Number of items to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of items to return")
+):
+    """Get a page of items."""
+    logger.info("Request to list items")
+    
+    def build() -> bytes:
+        try:
+            items = ItemService.get_all_items(skip=skip, limit=limit)
+        except Exception:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to fetch items"
+            )
+        return _ITEM_LIST_ADAPTER.dump_json(_ITEM_LIST_ADAPTER.validate_python(items))
+    
+    return _cached_json(_items_list_cache, (skip, limit), build)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Every item, one JSON document per line",
+            "content": {"application/x-ndjson": {}}
+        }
+    }
+)
+def export_items():
+    """Stream all items as newline delimited JSON."""
+    logger.info("Request to export all items")
     
-    items = ItemService.get_all_items()
+    lines = (orjson.dumps(item) + b"\n" for item in ItemService.iter_all_items())
     
-    return items
+    return StreamingResponse(lines, media_type="application/x-ndjson")
 
 
 @router.get(
@@ -78,18 +178,27 @@ def get_items():
 )
 def get_item(item_id: str = Path(..., description="The ID of the item to retrieve")):
     """Get a specific item by ID."""
-    logger.info(f"Request to get item with ID: {item_id}")
-    
-    item = ItemService.get_item_by_id(item_id)
+    logger.info("Request to get item with ID: %s", item_id)
     
-    if not item:
-        logger.warning(f"Item not found: {item_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Item not found with ID: {item_id}"
-        )
+    def build() -> bytes:
+        try:
+            item = ItemService.get_item_by_id(item_id)
+        except Exception:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to fetch item"
+            )
+        
+        if not item:
+            logger.warning("Item not found: %s", item_id)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Item not found with ID: {item_id}"
+            )
+        
+        return _ITEM_ADAPTER.dump_json(_ITEM_ADAPTER.validate_python(item))
     
-    return item
+    return _cached_json(_item_cache, _item_cache_key(item_id), build)
 
 
 @router.patch(
@@ -106,12 +215,12 @@ async def update_item(
     item_id: str = Path(..., description="The ID of the item to update")
 ):
     """Update an existing item."""
-    logger.info(f"Request to update item with ID: {item_id}")
-    update_data = {k: v for k, v in item.model_dump().items() if v is not None}
+    logger.info("Request to update item with ID: %s", item_id)
+    update_data = item.model_dump(exclude_unset=True, exclude_none=True)
     
     if not update_data:
         logger.warning("No valid fields to update")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={"detail": {"_": "No valid fields to update"}}
         )
@@ -121,18 +230,20 @@ async def update_item(
     
     if not success:
         if "id" in errors and "not found" in errors["id"]:
-            logger.warning(f"Item not found for update: {item_id}")
+            logger.warning("Item not found for update: %s", item_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Item not found with ID: {item_id}"
             )
         
-        logger.warning(f"Item update failed due to validation errors: {errors}")
-        return JSONResponse(
+        logger.warning("Item update failed due to validation errors: %s", errors)
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={"detail": errors}
         )
     
+    invalidate_item_cache(item_id)
+    
     return {"message": "Item updated successfully"}
 
 
@@ -144,24 +255,26 @@ async def update_item(
         status.HTTP_404_NOT_FOUND: {"model": ErrorResponse},
     }
 )
-def delete_item(item_id: str = Path(..., description="The ID of the item to delete")):
+async def delete_item(item_id: str = Path(..., description="The ID of the item to delete")):
     """Delete an item."""
-    logger.info(f"Request to delete item with ID: {item_id}")
+    logger.info("Request to delete item with ID: %s", item_id)
     
-    success, error = ItemService.delete_item(item_id)
+    success, error = await run_in_threadpool(ItemService.delete_item, item_id)
     
     if not success:
         if error and "not found" in error:
-            logger.warning(f"Item not found for deletion: {item_id}")
+            logger.warning("Item not found for deletion: %s", item_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Item not found with ID: {item_id}"
             )
         
-        logger.error(f"Item deletion failed: {error}")
+        logger.error("Item deletion failed: %s", error)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete item: {error}"
         )
     
+    invalidate_item_cache(item_id)
+    
     return {"message": "Item deleted successfully"}
\ No newline at end of file
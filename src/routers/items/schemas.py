@@ -1,16 +1,18 @@
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from src.utils.validators import validate_postcode, validate_start_date
 
 
 class ItemBase(BaseModel):
     """Base schema for Item operations."""
-    class Config:
-        """Pydantic configuration for handling ORM models."""
-        arbitrary_types_allowed = True
-        populate_by_name = True
-        from_attributes = True
+    # Pydantic configuration for handling ORM models
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        populate_by_name=True,
+        from_attributes=True,
+        extra="ignore"
+    )
 
 
 class ItemCreate(ItemBase):
@@ -21,29 +23,22 @@ class ItemCreate(ItemBase):
     users: List[str] = Field(..., description="List of users (each name < 50 chars)")
     startDate: datetime = Field(..., description="Start date (at least 1 week from creation)")
     
-    @field_validator('name')
-    def name_must_be_valid(cls, v):
-        """Validate name length."""
-        if len(v) > 50:
-            raise ValueError('Name must be less than 50 characters')
-        return v
-    
-    @field_validator('postcode')
+    @field_validator('postcode', mode='after')
     def postcode_must_be_valid(cls, v):
         """Validate US postcode format."""
         if not validate_postcode(v):
             raise ValueError('Invalid US postcode format')
         return v
     
-    @field_validator('users')
+    @field_validator('users', mode='after')
     def users_must_be_valid(cls, v):
         """Validate user names."""
-        for user in v:
-            if len(user) > 50:
-                raise ValueError(f'User name "{user}" exceeds 50 characters')
+        too_long = next((user for user in v if len(user) > 50), None)
+        if too_long is not None:
+            raise ValueError(f'User name "{too_long}" exceeds 50 characters')
         return v
     
-    @field_validator('startDate')
+    @field_validator('startDate', mode='after')
     def start_date_must_be_valid(cls, v):
         """Validate start date is at least 1 week in future."""
         if not validate_start_date(v):
@@ -67,23 +62,16 @@ class ItemUpdate(ItemBase):
     users: Optional[List[str]] = Field(None, description="List of users (each name < 50 chars)")
     startDate: Optional[datetime] = Field(None, description="Start date (at least 1 week from creation)")
     
-    @field_validator('name')
-    def name_must_be_valid(cls, v):
-        """Validate name length."""
-        if v is not None and len(v) > 50:
-            raise ValueError('Name must be less than 50 characters')
-        return v
-    
-    @field_validator('users')
+    @field_validator('users', mode='after')
     def users_must_be_valid(cls, v):
         """Validate user names."""
         if v is not None:
-            for user in v:
-                if len(user) > 50:
-                    raise ValueError(f'User name "{user}" exceeds 50 characters')
+            too_long = next((user for user in v if len(user) > 50), None)
+            if too_long is not None:
+                raise ValueError(f'User name "{too_long}" exceeds 50 characters')
         return v
     
-    @field_validator('startDate')
+    @field_validator('startDate', mode='after')
     def start_date_must_be_valid(cls, v):
         """Validate start date is at least 1 week in future."""
         if v is not None and not validate_start_date(v):
@@ -1,30 +1,53 @@
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from bson import ObjectId
-from datetime import datetime
+from bson.errors import InvalidId
+from starlette.concurrency import run_in_threadpool
 
 from src.db.models.items import Item
 from src.events import emit_event
 from src.utils.geo import fetch_zipcode_data, calculate_direction
 from src.utils.validators import (
     convert_keys_to_snake_case, 
-    convert_keys_to_camel_case,
     validate_item_data,
     validate_start_date
 )
 
 logger = logging.getLogger(__name__)
 
+# fields a PATCH may change, everything else in the payload is ignored
+_MUTABLE_FIELDS = frozenset({"name", "title", "users", "start_date"})
+
+
+def parse_object_id(item_id: str) -> Optional[ObjectId]:
+    """Parse an item ID once so queries can use the ObjectId directly.
+    
+    Args:
+        item_id: The ID as received in the request
+        
+    Returns:
+        ObjectId: The parsed ID, None if the format is invalid
+    """
+    # anything but a 24 character string is rejected without raising
+    if type(item_id) is not str or len(item_id) != 24:
+        return None
+    try:
+        # hex decoding is done in C and ObjectId takes the 12 raw bytes as is
+        return ObjectId(bytes.fromhex(item_id))
+    except (ValueError, InvalidId):
+        return None
+
 
 class ItemService:
     """Service for managing items."""
     
     @staticmethod
-    async def create_item(data: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
+    async def create_item(data: Dict[str, Any], validated: bool = False) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
         """Create a new item.
         
         Args:
             data: Item data in camelCase
+            validated: True if data was already validated by the ``ItemCreate`` schema
             
         Returns:
             tuple: (item_id, errors)
@@ -33,16 +56,17 @@ class ItemService:
         """
         snake_data = convert_keys_to_snake_case(data)
         
-        # Validate data
-        is_valid, errors = validate_item_data(snake_data)
-        if not is_valid:
-            logger.warning(f"Item validation failed: {errors}")
-            return None, errors
+        # Validate data, unless the request schema already enforced the same rules
+        if not validated:
+            is_valid, errors = validate_item_data(snake_data)
+            if not is_valid:
+                logger.warning("Item validation failed: %s", errors)
+                return None, errors
         
         try:
             location_data = await fetch_zipcode_data(snake_data["postcode"])
             if not location_data:
-                logger.error(f"Failed to fetch location data for postcode: {snake_data['postcode']}")
+                logger.error("Failed to fetch location data for postcode: %s", snake_data['postcode'])
                 return None, {"postcode": "Invalid or unrecognized postcode"}
             
             # Set latitude and longitude
@@ -56,31 +80,56 @@ class ItemService:
             )
             
             item = Item(**snake_data)
-            item.save()
+            # mongoengine is blocking, keep it off the event loop
+            await run_in_threadpool(item.save)
             
             emit_event("item_created", {"item_id": str(item.id)})
             
-            logger.info(f"Item created with ID: {item.id}")
+            logger.info("Item created with ID: %s", item.id)
             return str(item.id), None
             
         except Exception as e:
-            logger.error(f"Error creating item: {str(e)}")
+            logger.error("Error creating item: %s", e)
             return None, {"server": f"Internal error: {str(e)}"}
     
     @staticmethod
-    def get_all_items() -> List[Dict[str, Any]]:
-        """Get all items.
+    def get_all_items(skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get a page of items.
         
+        Args:
+            skip: Number of items to skip
+            limit: Maximum number of items to return
+            
         Returns:
             list: List of items in dict format with camelCase keys
+            
+        Raises:
+            Exception: If the database query fails, so a failure is never
+                mistaken for an empty page
         """
-        logger.info("Fetching all items")
+        logger.info("Fetching items (skip=%s, limit=%s)", skip, limit)
         try:
-            items = Item.objects.all()
-            return [convert_keys_to_camel_case(item.to_dict()) for item in items]
+            # raw dicts straight from pymongo, skipping Item construction per document
+            items = Item.objects.no_cache().as_pymongo().order_by("id").skip(skip).limit(limit)
+            return [Item.raw_to_camel_dict(doc) for doc in items]
         except Exception as e:
-            logger.error(f"Error fetching items: {str(e)}")
-            return []
+            logger.error("Error fetching items: %s", e)
+            raise
+    
+    @staticmethod
+    def iter_all_items(batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """Iterate over every item without loading the collection into memory.
+        
+        Args:
+            batch_size: Number of documents fetched from MongoDB per round-trip
+            
+        Yields:
+            dict: Item data with camelCase keys
+        """
+        logger.info("Streaming all items")
+        items = Item.objects.no_cache().as_pymongo().order_by("id").batch_size(batch_size)
+        for doc in items:
+            yield Item.raw_to_camel_dict(doc)
     
     @staticmethod
     def get_item_by_id(item_id: str) -> Optional[Dict[str, Any]]:
@@ -91,22 +140,27 @@ class ItemService:
             
         Returns:
             dict: Item data with camelCase keys if found, None otherwise
+            
+        Raises:
+            Exception: If the database query fails, so a failure is never
+                mistaken for a missing item
         """
-        logger.info(f"Fetching item with ID: {item_id}")
+        logger.info("Fetching item with ID: %s", item_id)
+        oid = parse_object_id(item_id)
+        if oid is None:
+            logger.warning("Invalid item ID format: %s", item_id)
+            return None
+        
         try:
-            if not ObjectId.is_valid(item_id):
-                logger.warning(f"Invalid item ID format: {item_id}")
-                return None
-            
-            item = Item.objects(id=item_id).first()
-            if not item:
-                logger.warning(f"Item not found with ID: {item_id}")
-                return None
-            
-            return convert_keys_to_camel_case(item.to_dict())
+            item = Item.objects(id=oid).first()
         except Exception as e:
-            logger.error(f"Error fetching item: {str(e)}")
+            logger.error("Error fetching item: %s", e)
+            raise
+        if not item:
+            logger.warning("Item not found with ID: %s", item_id)
             return None
+        
+        return item.to_dict_fast()
     
     @staticmethod
     async def update_item(item_id: str, data: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str, str]]]:
@@ -121,61 +175,68 @@ class ItemService:
                 - success: True if update was successful, False otherwise
                 - errors: Dictionary with field names as keys and error messages as values
         """
-        logger.info(f"Updating item with ID: {item_id}")
+        logger.info("Updating item with ID: %s", item_id)
         
         # Convert camelCase to snake_case
         snake_data = convert_keys_to_snake_case(data)
         
         try:
             # Validate ObjectId format
-            if not ObjectId.is_valid(item_id):
-                logger.warning(f"Invalid item ID format: {item_id}")
+            oid = parse_object_id(item_id)
+            if oid is None:
+                logger.warning("Invalid item ID format: %s", item_id)
                 return False, {"id": "Invalid item ID format"}
             
-            # Get existing item
-            item = Item.objects(id=item_id).first()
-            if not item:
-                logger.warning(f"Item not found with ID: {item_id}")
-                return False, {"id": "Item not found"}
-            
             # Only allow updating mutable fields
-            mutable_fields = ["name", "title", "users", "start_date"]
-            update_data = {k: v for k, v in snake_data.items() if k in mutable_fields}
+            update_data = {k: v for k, v in snake_data.items() if k in _MUTABLE_FIELDS}
             
+            # the name/users invariant is part of the update filter when it
+            # depends on the stored document, so check and write are one round-trip
+            query = {"_id": oid}
+            invariant_error = None
             if "name" in update_data and "users" not in update_data:
-                if update_data["name"] not in item.users:
-                    # Check against existing users if users not updated
-                    logger.warning(f"Name '{update_data['name']}' not in users list")
-                    return False, {"name": "Name must be included in the users list"}
+                # Check against existing users if users not updated
+                query["users"] = update_data["name"]
+                invariant_error = {"name": "Name must be included in the users list"}
             elif "name" in update_data and "users" in update_data:
                 # Check against new users if both updated
                 if update_data["name"] not in update_data["users"]:
-                    logger.warning(f"Name '{update_data['name']}' not in updated users list")
+                    logger.warning("Name '%s' not in updated users list", update_data['name'])
                     return False, {"name": "Name must be included in the users list"}
             elif "users" in update_data and "name" not in update_data:
                 # Check existing name against new users
-                if item.name not in update_data["users"]:
-                    logger.warning(f"Existing name '{item.name}' not in updated users list")
-                    return False, {"users": "Users list must include the item name"}
+                query["name"] = {"$in": update_data["users"]}
+                invariant_error = {"users": "Users list must include the item name"}
             
             # Validate start_date if provided
             if "start_date" in update_data and not validate_start_date(update_data["start_date"]):
                 logger.warning("Invalid start date")
                 return False, {"start_date": "Start date must be at least 1 week after creation date"}
             
-            for field, value in update_data.items():
-                setattr(item, field, value)
-            
-            item.updated_at = datetime.utcnow()
-            item.save()
+            # partial update: only the changed fields go over the wire and the
+            # server stamps updated_at, instead of re-saving the whole document
+            update = {"$currentDate": {"updated_at": True}}
+            if update_data:
+                update["$set"] = update_data
+            collection = Item._get_collection()
+            result = await run_in_threadpool(collection.update_one, query, update)
+            if not result.matched_count:
+                # no match is either a missing item or a failed invariant
+                if invariant_error and await run_in_threadpool(
+                    collection.count_documents, {"_id": oid}, limit=1
+                ):
+                    logger.warning("Name/users invariant failed for item: %s", item_id)
+                    return False, invariant_error
+                logger.warning("Item not found with ID: %s", item_id)
+                return False, {"id": "Item not found"}
             
-            emit_event("item_updated", {"item_id": str(item.id)})
+            emit_event("item_updated", {"item_id": str(oid)})
             
-            logger.info(f"Item updated: {item_id}")
+            logger.info("Item updated: %s", item_id)
             return True, None
             
         except Exception as e:
-            logger.error(f"Error updating item: {str(e)}")
+            logger.error("Error updating item: %s", e)
             return False, {"server": f"Internal error: {str(e)}"}
     
     @staticmethod
@@ -190,26 +251,26 @@ class ItemService:
                 - success: True if deletion was successful, False otherwise
                 - error: Error message if deletion failed, None otherwise
         """
-        logger.info(f"Deleting item with ID: {item_id}")
+        logger.info("Deleting item with ID: %s", item_id)
         
         try:
-            if not ObjectId.is_valid(item_id):
-                logger.warning(f"Invalid item ID format: {item_id}")
+            oid = parse_object_id(item_id)
+            if oid is None:
+                logger.warning("Invalid item ID format: %s", item_id)
                 return False, "Invalid item ID format"
             
-            # Get item to check if it exists
-            item = Item.objects(id=item_id).first()
-            if not item:
-                logger.warning(f"Item not found with ID: {item_id}")
+            # a single delete_one on the collection, the deleted count tells
+            # whether the item existed; no queryset or delete rules involved
+            result = Item._get_collection().delete_one({"_id": oid})
+            if not result.deleted_count:
+                logger.warning("Item not found with ID: %s", item_id)
                 return False, "Item not found"
             
-            item.delete()
-            
             emit_event("item_deleted", {"item_id": item_id})
             
-            logger.info(f"Item deleted: {item_id}")
+            logger.info("Item deleted: %s", item_id)
             return True, None
             
         except Exception as e:
-            logger.error(f"Error deleting item: {str(e)}")
+            logger.error("Error deleting item: %s", e)
             return False, f"Internal error: {str(e)}"
\ No newline at end of file
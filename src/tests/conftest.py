@@ -4,17 +4,29 @@ import mongoengine
 from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock
 import datetime
+import os
 
-# Patch the main app to prevent connection issues during import
-with patch('src.db.connection.connect_to_database'):
+# settings are read at import, so the CORS tests need their origin set first
+os.environ.setdefault("CORS_ORIGINS", '["http://allowed.example"]')
+
+# Patch the main app to prevent connection issues during import; the
+# connection is owned by the mock_mongo fixture, so the app lifespan must
+# not close it either
+with patch('src.db.connection.connect_to_database'), patch('src.db.connection.disconnect_from_database'):
     from src.main import app
 
 from src.db.models.items import Item
+from src import events
+from src.routers.items import routes as item_routes
+from src.utils import geo
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_client():
-    """Create a test client for FastAPI app."""
+    """Create a test client for FastAPI app, started once per session.
+    
+    Tests get fresh state from the per-test collection drop and cache clear.
+    """
     # Disable app startup/shutdown events to prevent MongoDB connection issues
     app.router.on_startup = []
     app.router.on_shutdown = []
@@ -23,26 +35,69 @@ def test_client():
         yield client
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def mock_mongo():
-    """Mock MongoDB connection for tests."""
+    """Mock MongoDB connection once for the whole test session.
+    
+    Yields:
+        Database: The mongomock database, kept for cheap per-test cleanup
+    """
     # Disconnect any existing connections
     mongoengine.disconnect_all()
     
     # Connect to MongoMock
-    mongoengine.connect(
+    client = mongoengine.connect(
         db='mongoenginetest',
         host='mongodb://localhost',
         alias='default',
         mongo_client_class=mongomock.MongoClient
     )
     
-    yield
+    yield client['mongoenginetest']
     
     # Clean up
     mongoengine.disconnect_all()
 
 
+@pytest.fixture(autouse=True)
+def clean_collections(mock_mongo):
+    """Start every test with an empty database.
+    
+    Collections are dropped through the mongomock handle directly, so
+    mongoengine's connection registry and document metadata are untouched.
+    """
+    for name in mock_mongo.list_collection_names():
+        mock_mongo.drop_collection(name)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start every test with an empty response cache."""
+    item_routes._items_list_cache.clear()
+    item_routes._item_cache.clear()
+    yield
+
+
+@pytest.fixture
+def isolated_dispatcher(monkeypatch):
+    """Detach the event dispatcher state from the one the test client runs."""
+    for name in ("_queue", "_loop", "_worker"):
+        monkeypatch.setattr(events, name, None)
+    yield events
+
+
+@pytest.fixture
+def isolated_zipcode_cache(monkeypatch):
+    """Start with empty zipcode caches and no shared API client."""
+    geo._zipcode_cache.clear()
+    geo._unknown_zipcode_cache.clear()
+    monkeypatch.setattr(geo, "_client", None)
+    yield geo
+    geo._zipcode_cache.clear()
+    geo._unknown_zipcode_cache.clear()
+
+
 @pytest.fixture
 def mock_zipcode_api():
     """Mock the external zipcode API."""
@@ -54,7 +109,7 @@ def mock_zipcode_api():
         "state_abbreviation": "NY"
     }
     
-    with patch('src.utils.geo.fetch_zipcode_data', new_callable=AsyncMock) as mock:
+    with patch('src.routers.items.service.fetch_zipcode_data', new_callable=AsyncMock) as mock:
         mock.return_value = mock_response
         yield mock
 
@@ -62,7 +117,7 @@ def mock_zipcode_api():
 @pytest.fixture
 def mock_failed_zipcode_api():
     """Mock a failed zipcode API response."""
-    with patch('src.utils.geo.fetch_zipcode_data', new_callable=AsyncMock) as mock:
+    with patch('src.routers.items.service.fetch_zipcode_data', new_callable=AsyncMock) as mock:
         mock.return_value = None
         yield mock
 
@@ -1,9 +1,106 @@
 import pytest
+import asyncio
+import hashlib
+import json
+import logging
+import subprocess
+import sys
+import threading
+import time
 from bson import ObjectId
 import datetime
+import httpx
+from unittest.mock import MagicMock, patch
+from pymongo.errors import ServerSelectionTimeoutError
 from fastapi.testclient import TestClient
 
 from src.db.models.items import Item
+from src import events
+from src.auth import middleware as auth_middleware
+from src.auth.middleware import AuthMiddleware
+from src.middleware import LoggingMiddleware
+from src.config import settings
+from src.utils import geo
+from src.utils.geo import calculate_direction
+from src.utils.validators import (
+    convert_keys_to_camel_case,
+    convert_keys_to_snake_case,
+    validate_postcode
+)
+
+
+def test_create_item(test_client: TestClient, auth_headers, valid_item_data, mock_zipcode_api):
+    """Test creating a new item."""
+    response = test_client.post("/api/v1/items", headers=auth_headers, json=valid_item_data)
+    
+    assert response.status_code == 201
+    item = Item.objects(id=response.json()["id"]).first()
+    assert item is not None
+    assert item.name == valid_item_data["name"]
+    assert item.direction_from_new_york == "NE"
+
+
+def test_create_item_invalid_data(test_client: TestClient, auth_headers, invalid_item_data, mock_zipcode_api):
+    """Test the request schema rejects invalid item data before it reaches the service."""
+    response = test_client.post("/api/v1/items", headers=auth_headers, json=invalid_item_data)
+    
+    assert response.status_code == 422
+    assert Item.objects.count() == 0
+    mock_zipcode_api.assert_not_called()
+
+
+@pytest.mark.parametrize("lat, lon, expected", [
+    (42.0, -73.0, "NE"),
+    (42.0, -75.0, "NW"),
+    (39.0, -73.0, "SE"),
+    (39.0, -75.0, "SW"),
+    (40.7128, -74.0060, "NE"),
+])
+def test_calculate_direction(lat, lon, expected):
+    """Test the direction from New York for each quadrant and the reference point."""
+    assert calculate_direction(lat, lon) == expected
+
+
+@pytest.mark.parametrize("postcode, expected", [
+    ("10001", True),
+    ("10001-1234", True),
+    ("1000", False),
+    ("100011", False),
+    ("10001_1234", False),
+    ("10001-123a", False),
+    ("10001\n", False),
+    ("", False),
+])
+def test_validate_postcode(postcode, expected):
+    """Test US postcode validation for both formats and common malformed values."""
+    assert validate_postcode(postcode) is expected
+
+
+def test_convert_keys_case_round_trip():
+    """Test key case conversion of nested dicts and lists of dicts both ways."""
+    camel = {
+        "directionFromNewYork": "NE",
+        "startDate": "2030-01-01",
+        "meta": {"createdAt": 1, "tags": ["a"]},
+        "history": [{"updatedAt": 2}],
+    }
+    snake = {
+        "direction_from_new_york": "NE",
+        "start_date": "2030-01-01",
+        "meta": {"created_at": 1, "tags": ["a"]},
+        "history": [{"updated_at": 2}],
+    }
+    
+    assert convert_keys_to_snake_case(camel) == snake
+    assert convert_keys_to_camel_case(snake) == camel
+
+
+def test_create_item_unknown_postcode(test_client: TestClient, auth_headers, valid_item_data, mock_failed_zipcode_api):
+    """Test creating an item when the postcode lookup fails."""
+    response = test_client.post("/api/v1/items", headers=auth_headers, json=valid_item_data)
+    
+    assert response.status_code == 400
+    assert "postcode" in response.json()["detail"]
 
 
 def test_get_items(test_client: TestClient, auth_headers, sample_item):
@@ -32,6 +129,102 @@ def test_get_items_empty(test_client: TestClient, auth_headers):
     assert len(response.json()) == 0
 
 
+def test_get_items_pagination(test_client: TestClient, auth_headers, sample_item):
+    """Test paging through items with skip and limit."""
+    start_date = datetime.datetime.now(datetime.UTC) + datetime.timedelta(weeks=2)
+    for i in range(3):
+        Item(
+            name=f"Item {i}",
+            postcode="10001",
+            latitude=40.7128,
+            longitude=-74.0060,
+            direction_from_new_york="NE",
+            users=[f"Item {i}"],
+            start_date=start_date
+        ).save()
+    
+    response = test_client.get("/api/v1/items?limit=2", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert response.json()[0]["id"] == str(sample_item.id)
+    
+    response = test_client.get("/api/v1/items?skip=2&limit=2", headers=auth_headers)
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()] == ["Item 1", "Item 2"]
+
+
+def test_get_items_invalid_limit(test_client: TestClient, auth_headers):
+    """Test the page size is bounded."""
+    response = test_client.get("/api/v1/items?limit=0", headers=auth_headers)
+    
+    assert response.status_code == 422
+
+
+def test_export_items(test_client: TestClient, auth_headers, sample_item):
+    """Test exporting items as newline delimited JSON."""
+    response = test_client.get("/api/v1/items/export", headers=auth_headers)
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["id"] == str(sample_item.id)
+    assert "directionFromNewYork" in json.loads(lines[0])
+
+
+def test_get_items_cache_invalidated_on_delete(test_client: TestClient, auth_headers, sample_item):
+    """Test the cached item list is dropped when an item is deleted."""
+    response = test_client.get("/api/v1/items", headers=auth_headers)
+    assert len(response.json()) == 1
+    
+    test_client.delete(f"/api/v1/items/{sample_item.id}", headers=auth_headers)
+    
+    response = test_client.get("/api/v1/items", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 0
+
+
+@pytest.mark.parametrize("path", ["/api/v1/items", "/api/v1/items/{item_id}"])
+def test_get_items_cache_hit_matches_miss(test_client: TestClient, auth_headers, sample_item, path):
+    """Test a cached response has exactly the body of the response that filled the cache."""
+    url = path.format(item_id=sample_item.id)
+    miss = test_client.get(url, headers=auth_headers)
+    hit = test_client.get(url, headers=auth_headers)
+
+    assert miss.headers["x-cache"] == "MISS"
+    assert hit.headers["x-cache"] == "HIT"
+    assert hit.content == miss.content
+    assert "cache-control" not in hit.headers
+
+
+def test_get_item_cache_invalidated_for_any_id_case(test_client: TestClient, auth_headers, sample_item):
+    """Test an update drops the cached item however its ID was spelled when cached."""
+    upper_url = f"/api/v1/items/{str(sample_item.id).upper()}"
+    assert test_client.get(upper_url, headers=auth_headers).json()["title"] == "Sample Title"
+
+    test_client.patch(f"/api/v1/items/{sample_item.id}", headers=auth_headers, json={"title": "New Title"})
+
+    response = test_client.get(upper_url, headers=auth_headers)
+    assert response.headers["x-cache"] == "MISS"
+    assert response.json()["title"] == "New Title"
+
+
+@pytest.mark.parametrize("path", ["/api/v1/items", "/api/v1/items/{item_id}"])
+def test_get_items_database_error_not_cached(test_client: TestClient, auth_headers, sample_item, path):
+    """Test a failed read returns 500 and is not served from the cache once the database is back."""
+    url = path.format(item_id=sample_item.id)
+    outage = MagicMock(side_effect=ServerSelectionTimeoutError("database down"))
+    outage.no_cache.side_effect = ServerSelectionTimeoutError("database down")
+    with patch.object(Item, "objects", outage):
+        response = test_client.get(url, headers=auth_headers)
+    assert response.status_code == 500
+
+    response = test_client.get(url, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["x-cache"] == "MISS"
+    assert response.json()
+
+
 def test_get_item_by_id(test_client: TestClient, auth_headers, sample_item):
     """Test getting a specific item by ID."""
     response = test_client.get(f"/api/v1/items/{sample_item.id}", headers=auth_headers)
@@ -43,6 +236,11 @@ def test_get_item_by_id(test_client: TestClient, auth_headers, sample_item):
     assert "directionFromNewYork" in response.json()
 
 
+def test_item_to_dict_fast_matches_to_camel_dict(sample_item):
+    """Test the generated serializer produces the same dict as to_camel_dict."""
+    assert sample_item.to_dict_fast() == sample_item.to_camel_dict()
+
+
 def test_get_item_by_id_not_found(test_client: TestClient, auth_headers):
     """Test getting a non-existent item."""
     fake_id = str(ObjectId())
@@ -78,6 +276,11 @@ def test_update_item(test_client: TestClient, auth_headers, sample_item):
     
     assert response.status_code == 200
     assert "message" in response.json()
+    
+    updated_item = Item.objects(id=sample_item.id).first()
+    assert updated_item.name == "Updated Sample Item"
+    assert updated_item.title == "Updated Title"
+    assert updated_item.postcode == sample_item.postcode
 
 
 def test_update_item_no_fields(test_client: TestClient, auth_headers, sample_item):
@@ -94,6 +297,32 @@ def test_update_item_no_fields(test_client: TestClient, auth_headers, sample_ite
     assert "No valid fields to update" in response.json()["detail"]["_"]
 
 
+def test_update_item_name_not_in_users(test_client: TestClient, auth_headers, sample_item):
+    """Test updating the name to one missing from the stored users list."""
+    response = test_client.patch(
+        f"/api/v1/items/{sample_item.id}",
+        headers=auth_headers,
+        json={"name": "Someone Else"}
+    )
+
+    assert response.status_code == 400
+    assert "name" in response.json()["detail"]
+    assert Item.objects(id=sample_item.id).first().name == "Sample Item"
+
+
+def test_update_item_users_without_name(test_client: TestClient, auth_headers, sample_item):
+    """Test updating users to a list without the stored name."""
+    response = test_client.patch(
+        f"/api/v1/items/{sample_item.id}",
+        headers=auth_headers,
+        json={"users": ["User Two"]}
+    )
+
+    assert response.status_code == 400
+    assert "users" in response.json()["detail"]
+    assert "Sample Item" in Item.objects(id=sample_item.id).first().users
+
+
 def test_update_item_not_found(test_client: TestClient, auth_headers):
     """Test updating a non-existent item."""
     fake_id = str(ObjectId())
@@ -165,4 +394,384 @@ def test_empty_token(test_client: TestClient):
     assert response.status_code == 401
     assert "detail" in response.json()
     # Updated to match the actual error message
-    assert "Invalid Authorization header format" in response.json()["detail"]
\ No newline at end of file
+    assert "Invalid Authorization header format" in response.json()["detail"]
+
+
+def test_health_check_skips_auth(test_client: TestClient):
+    """Test the health check endpoint does not require authentication."""
+    response = test_client.get("/")
+    
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+
+
+@pytest.mark.parametrize("path,headers,expected_status", [
+    ("/svc/api/v1/items", {}, 401),
+    ("/svc/api/v1/items", {"Authorization": "Bearer test-token"}, 200),
+    ("/svc/", {}, 200),
+    ("/svc/openapi.json", {}, 200),
+    ("/svc/not-a-route", {}, 401),
+])
+def test_auth_behind_root_path(test_client: TestClient, path, headers, expected_status):
+    """Test public paths are matched without the root_path and everything else needs a token."""
+    client = TestClient(test_client.app, root_path="/svc")
+    response = client.get(path, headers=headers)
+
+    assert response.status_code == expected_status
+
+
+def test_cors_preflight_skips_auth(test_client: TestClient):
+    """Test a preflight from a configured origin is answered without a token."""
+    response = test_client.options("/api/v1/items", headers={
+        "Origin": "http://allowed.example",
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "Authorization, Content-Type",
+    })
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://allowed.example"
+    assert "POST" in response.headers["access-control-allow-methods"]
+
+
+def test_cors_headers_on_unauthorized(test_client: TestClient):
+    """Test a 401 still carries the CORS header so the browser can read it."""
+    response = test_client.get("/api/v1/items", headers={"Origin": "http://allowed.example"})
+
+    assert response.status_code == 401
+    assert response.headers["access-control-allow-origin"] == "http://allowed.example"
+
+
+def test_cors_rejects_unknown_origin(test_client: TestClient, auth_headers):
+    """Test an origin that is not configured gets no CORS headers."""
+    response = test_client.get("/api/v1/items", headers={**auth_headers, "Origin": "http://other.example"})
+    preflight = test_client.options("/api/v1/items", headers={
+        "Origin": "http://other.example",
+        "Access-Control-Request-Method": "GET",
+    })
+
+    assert "access-control-allow-origin" not in response.headers
+    assert preflight.status_code == 400
+
+
+def test_oversized_token(test_client: TestClient):
+    """Test a token that is too long is rejected before validation."""
+    headers = {"Authorization": "Bearer " + "a" * 9000}
+    response = test_client.get("/api/v1/items", headers=headers)
+    
+    assert response.status_code == 401
+    assert "Malformed bearer token" in response.json()["detail"]
+
+
+def test_token_cache_skips_repeated_validation(test_client: TestClient):
+    """Test a cached token is not validated again and is keyed by its digest."""
+    token = b"cache-test-token"
+    auth_middleware._token_cache.clear()
+    headers = {"Authorization": f"Bearer {token.decode()}"}
+    with patch.object(AuthMiddleware, "_validate_token", return_value={}) as validate:
+        for _ in range(2):
+            response = test_client.get("/api/v1/items", headers=headers)
+            assert response.status_code == 200
+
+    validate.assert_called_once_with(token)
+    assert list(auth_middleware._token_cache) == [hashlib.sha256(token).digest()]
+
+
+@pytest.mark.parametrize("level,path,expected", [
+    (logging.INFO, "/api/v1/items", True),
+    (logging.WARNING, "/api/v1/items", False),
+    (logging.INFO, "/", False),
+])
+def test_logging_middleware_process_time_header(test_client: TestClient, auth_headers, caplog, level, path, expected):
+    """Test X-Process-Time is only added when INFO is on and the path is not the health check."""
+    caplog.set_level(level, logger="src.middleware")
+    response = test_client.get(path, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert ("x-process-time" in response.headers) is expected
+
+
+def test_logging_middleware_logs_and_reraises(caplog):
+    """Test an exception from the app is logged and propagated."""
+    async def failing_app(scope, receive, send):
+        raise RuntimeError("app failure")
+
+    caplog.set_level(logging.INFO, logger="src.middleware")
+    client = TestClient(LoggingMiddleware(failing_app))
+    with pytest.raises(RuntimeError, match="app failure"):
+        client.get("/api/v1/items")
+
+    assert any(
+        record.levelno == logging.ERROR and "app failure" in record.getMessage()
+        for record in caplog.records
+    )
+
+
+def test_emit_async_awaits_only_async_listeners():
+    """Test emit_async awaits async listeners and ignores sync ones, even failing ones."""
+    received = []
+
+    async def async_listener(data):
+        received.append(data)
+
+    def sync_listener(data):
+        raise AssertionError("sync listeners are not called by emit_async")
+
+    async def failing_listener(data):
+        raise RuntimeError("listener failure")
+
+    for listener in (sync_listener, failing_listener, async_listener):
+        events.register_listener("test_emit_async", listener)
+    try:
+        asyncio.run(events.emit_async("test_emit_async", {"item_id": "1"}))
+    finally:
+        for listener in (sync_listener, failing_listener, async_listener):
+            events.remove_listener("test_emit_async", listener)
+
+    assert received == [{"item_id": "1"}]
+
+
+def _run_dispatcher(emit, **options):
+    """Run emit between starting and stopping the event dispatcher."""
+    async def run():
+        await events.start_event_dispatcher(**options)
+        try:
+            await emit()
+        finally:
+            await events.stop_event_dispatcher()
+
+    asyncio.run(run())
+
+
+def test_dispatcher_batches_up_to_max_batch(isolated_dispatcher, monkeypatch):
+    """Test the dispatcher delivers queued events in batches of at most max_batch."""
+    batches = []
+
+    def dispatch_batch(batch):
+        # the test client's dispatcher may flush its own events meanwhile
+        if batch[0][0] == "test_batching":
+            batches.append(list(batch))
+
+    monkeypatch.setattr(events, "_dispatch_batch", dispatch_batch)
+
+    async def emit():
+        for i in range(5):
+            events.emit_event("test_batching", {"i": i})
+
+    _run_dispatcher(emit, flush_interval=10, max_batch=2)
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [data["i"] for batch in batches for _, data in batch] == [0, 1, 2, 3, 4]
+
+
+def test_dispatcher_flushes_on_stop(isolated_dispatcher):
+    """Test stopping the dispatcher delivers queued events without waiting for the flush interval."""
+    received = []
+    events.register_listener("test_flush_on_stop", received.append)
+    try:
+        async def emit():
+            events.emit_event("test_flush_on_stop", {"i": 1})
+            await asyncio.sleep(0)
+
+        started = time.monotonic()
+        _run_dispatcher(emit, flush_interval=10)
+        elapsed = time.monotonic() - started
+    finally:
+        events.remove_listener("test_flush_on_stop", received.append)
+
+    assert received == [{"i": 1}]
+    assert elapsed < 5
+
+
+def test_dispatcher_accepts_events_from_threadpool(isolated_dispatcher):
+    """Test events emitted from a worker thread reach the dispatcher."""
+    received = []
+    events.register_listener("test_threadpool_emit", received.append)
+    try:
+        async def emit():
+            await asyncio.to_thread(events.emit_event, "test_threadpool_emit", {"i": 1})
+
+        _run_dispatcher(emit, flush_interval=0.01)
+    finally:
+        events.remove_listener("test_threadpool_emit", received.append)
+
+    assert received == [{"i": 1}]
+
+
+def test_dispatcher_failing_listener_does_not_stop_others(isolated_dispatcher):
+    """Test a failing listener does not keep the other listeners from any event."""
+    received = []
+
+    def failing_listener(data):
+        raise RuntimeError("listener failure")
+
+    for listener in (failing_listener, received.append):
+        events.register_listener("test_failing_listener", listener)
+    try:
+        async def emit():
+            for i in range(3):
+                events.emit_event("test_failing_listener", {"i": i})
+
+        _run_dispatcher(emit, flush_interval=0.01)
+    finally:
+        for listener in (failing_listener, received.append):
+            events.remove_listener("test_failing_listener", listener)
+
+    assert received == [{"i": 0}, {"i": 1}, {"i": 2}]
+
+
+def test_dispatcher_survives_failed_batch(isolated_dispatcher, monkeypatch):
+    """Test the worker keeps delivering after a batch fails."""
+    batches = []
+
+    def dispatch_batch(batch):
+        if batch[0][0] != "test_failed_batch":
+            return
+        batches.append(list(batch))
+        if len(batches) == 1:
+            raise RuntimeError("sink failure")
+
+    monkeypatch.setattr(events, "_dispatch_batch", dispatch_batch)
+
+    async def emit():
+        events.emit_event("test_failed_batch", {"i": 1})
+        await asyncio.sleep(0.05)
+        events.emit_event("test_failed_batch", {"i": 2})
+
+    _run_dispatcher(emit, flush_interval=0.01)
+
+    assert [data["i"] for batch in batches for _, data in batch] == [1, 2]
+
+
+def test_emit_event_after_dispatcher_loop_closed(isolated_dispatcher, monkeypatch):
+    """Test emitting while the dispatcher loop is closed delivers directly instead of raising."""
+    received = []
+    closed_loop = asyncio.new_event_loop()
+    closed_loop.close()
+    monkeypatch.setattr(events, "_queue", asyncio.Queue())
+    monkeypatch.setattr(events, "_loop", closed_loop)
+    events.register_listener("test_closed_loop", received.append)
+    try:
+        events.emit_event("test_closed_loop", {"i": 1})
+    finally:
+        events.remove_listener("test_closed_loop", received.append)
+
+    assert received == [{"i": 1}]
+
+
+def test_dispatcher_awaits_async_and_offloads_sync_listeners(isolated_dispatcher):
+    """Test async listeners are awaited on the loop and sync listeners run in a worker thread."""
+    threads = {}
+
+    async def async_listener(data):
+        await asyncio.sleep(0)
+        threads["async"] = threading.get_ident()
+
+    def sync_listener(data):
+        threads["sync"] = threading.get_ident()
+
+    for listener in (async_listener, sync_listener):
+        events.register_listener("test_listener_threads", listener)
+    try:
+        async def emit():
+            threads["loop"] = threading.get_ident()
+            events.emit_event("test_listener_threads", {"i": 1})
+
+        _run_dispatcher(emit, flush_interval=0.01)
+    finally:
+        for listener in (async_listener, sync_listener):
+            events.remove_listener("test_listener_threads", listener)
+
+    assert threads["async"] == threads["loop"]
+    assert threads["sync"] != threads["loop"]
+
+
+def test_emit_event_without_dispatcher_schedules_task(isolated_dispatcher):
+    """Test emitting on a loop without a dispatcher delivers through a tracked background task."""
+    received = []
+
+    async def async_listener(data):
+        received.append(("async", data))
+
+    def sync_listener(data):
+        received.append(("sync", data))
+
+    for listener in (async_listener, sync_listener):
+        events.register_listener("test_pending_emit", listener)
+    try:
+        async def run():
+            events.emit_event("test_pending_emit", {"i": 1})
+            assert received == []
+            assert len(events._pending) == 1
+            await asyncio.gather(*events._pending)
+
+        asyncio.run(run())
+    finally:
+        for listener in (async_listener, sync_listener):
+            events.remove_listener("test_pending_emit", listener)
+
+    assert received == [("sync", {"i": 1}), ("async", {"i": 1})]
+    assert not events._pending
+
+
+def _fetch_zipcodes(handler, postcodes, concurrent=False):
+    """Look up postcodes against a mocked zipcode API, concurrently or one after another."""
+    async def run():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport, base_url=settings.ZIP_API_BASE_URL) as client:
+            geo._client = client
+            if concurrent:
+                return await asyncio.gather(*(geo.fetch_zipcode_data(postcode) for postcode in postcodes))
+            return [await geo.fetch_zipcode_data(postcode) for postcode in postcodes]
+
+    return asyncio.run(run())
+
+
+def test_fetch_zipcode_data_concurrent_calls_share_request(isolated_zipcode_cache):
+    """Test concurrent lookups of one postcode make a single API request."""
+    requests = []
+
+    async def handler(request):
+        requests.append(request.url.path.rsplit("/", 1)[-1])
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={
+            "places": [{
+                "latitude": "40.7484",
+                "longitude": "-73.9967",
+                "place name": "New York City",
+                "state": "New York",
+                "state abbreviation": "NY"
+            }]
+        })
+
+    results = _fetch_zipcodes(handler, ["10001"] * 20, concurrent=True)
+
+    assert requests == ["10001"]
+    assert all(result == results[0] for result in results)
+    assert results[0]["latitude"] == 40.7484
+
+
+@pytest.mark.parametrize("status_code,expected_requests", [
+    (404, 1),
+    (500, 2),
+])
+def test_fetch_zipcode_data_caches_only_unknown_postcodes(isolated_zipcode_cache, status_code, expected_requests):
+    """Test an unknown postcode is cached while a failed request is retried."""
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path.rsplit("/", 1)[-1])
+        return httpx.Response(status_code)
+
+    results = _fetch_zipcodes(handler, ["99999", "99999"])
+
+    assert results == [None, None]
+    assert len(requests) == expected_requests
+
+
+def test_routes_exist_without_lifespan():
+    """Test the API routes and schema are available on import, before any startup has run."""
+    code = "import src.main; print(sorted(src.main.app.openapi()['paths']))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert "/api/v1/items" in result.stdout
+    assert "/api/v1/items/{item_id}" in result.stdout
@@ -1,5 +1,7 @@
+import asyncio
 import logging
 import httpx
+from cachetools import TTLCache
 from typing import Dict, Tuple, Optional
 
 from src.config import settings
@@ -7,9 +9,47 @@ from src.db.models.items import Direction
 
 logger = logging.getLogger(__name__)
 
+# postcode -> location data; postcode coordinates practically never change
+_zipcode_cache = TTLCache(maxsize=settings.ZIP_CACHE_SIZE, ttl=settings.ZIP_CACHE_TTL)
+# postcodes the API does not know, kept for a shorter time
+_unknown_zipcode_cache = TTLCache(maxsize=settings.ZIP_CACHE_SIZE, ttl=settings.ZIP_NEGATIVE_CACHE_TTL)
+# lookups currently waiting on the API, so concurrent misses share one request
+_in_flight: Dict[str, asyncio.Task] = {}
+
+# shared client so connections (and their TLS sessions) are reused across lookups
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared zipcode API client, creating it on first use.
+    
+    Created lazily so it binds to the running event loop rather than the one
+    (if any) active at import time.
+    
+    Returns:
+        httpx.AsyncClient: Client pointed at the zipcode API
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=settings.ZIP_API_BASE_URL,
+            http2=True,
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=50)
+        )
+    return _client
+
+
+async def close_http_client():
+    """Close the shared zipcode API client, called on application shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 async def fetch_zipcode_data(postcode: str) -> Optional[Dict]:
-    """Fetch location data for a US zipcode from external API.
+    """Fetch location data for a US zipcode, using the cache when possible.
     
     Args:
         postcode: The US postal code to lookup
@@ -18,44 +58,111 @@ async def fetch_zipcode_data(postcode: str) -> Optional[Dict]:
         dict: Location data including latitude and longitude
         None: If the request fails or postcode is invalid
     """
-    url = f"{settings.ZIP_API_BASE_URL}/{postcode}"
-    logger.info(f"Fetching zipcode data from: {url}")
+    key = postcode.strip()
+    
+    data = _zipcode_cache.get(key)
+    if data is not None:
+        return data
+    if key in _unknown_zipcode_cache:
+        return None
+    
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_lookup_zipcode_data(key))
+        _in_flight[key] = task
+        task.add_done_callback(lambda _: _in_flight.pop(key, None))
+    
+    # shielded so a cancelled request does not cancel the lookup others wait on
+    return await asyncio.shield(task)
+
+
+async def _lookup_zipcode_data(postcode: str) -> Optional[Dict]:
+    """Request location data from the API and store the outcome in the cache.
+    
+    Args:
+        postcode: The normalized US postal code to lookup
+        
+    Returns:
+        dict: Location data including latitude and longitude
+        None: If the request fails or postcode is invalid
+    """
+    data, known = await _request_zipcode_data(postcode)
+    if data is not None:
+        _zipcode_cache[postcode] = data
+    elif not known:
+        _unknown_zipcode_cache[postcode] = True
+    return data
+
+
+async def _request_zipcode_data(postcode: str) -> Tuple[Optional[Dict], bool]:
+    """Fetch location data for a US zipcode from external API.
+    
+    Args:
+        postcode: The US postal code to lookup
+        
+    Returns:
+        tuple: (data, known)
+            - data: Location data including latitude and longitude, None on failure
+            - known: False only if the API answered that the postcode does not
+              exist, so transient failures are not cached
+    """
+    logger.info("Fetching zipcode data from: %s/%s", settings.ZIP_API_BASE_URL, postcode)
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            
-            if response.status_code != 200:
-                logger.warning(f"Failed to fetch zipcode data: {response.status_code}")
-                return None
-            
-            data = response.json()
-            logger.debug(f"Received zipcode data: {data}")
-            
-            # Extract coordinates from the response
-            # The API returns data in a specific format we need to parse
-            places = data.get("places", [])
-            if not places:
-                logger.warning(f"No location data found for postcode: {postcode}")
-                return None
-            
-            place = places[0]
-            
-            return {
-                "latitude": float(place.get("latitude")),
-                "longitude": float(place.get("longitude")),
-                "place_name": place.get("place name"),
-                "state": place.get("state"),
-                "state_abbreviation": place.get("state abbreviation")
-            }
+        response = await get_http_client().get(f"/{postcode}")
+        
+        if response.status_code == 404:
+            logger.warning("Unknown postcode: %s", postcode)
+            return None, False
+        
+        if response.status_code != 200:
+            logger.warning("Failed to fetch zipcode data: %s", response.status_code)
+            return None, True
+        
+        data = response.json()
+        logger.debug("Received zipcode data: %s", data)
+        
+        # Extract coordinates from the response
+        # The API returns data in a specific format we need to parse
+        places = data.get("places", [])
+        if not places:
+            logger.warning("No location data found for postcode: %s", postcode)
+            return None, False
+        
+        place = places[0]
+        
+        return {
+            "latitude": float(place.get("latitude")),
+            "longitude": float(place.get("longitude")),
+            "place_name": place.get("place name"),
+            "state": place.get("state"),
+            "state_abbreviation": place.get("state abbreviation")
+        }, True
     except Exception as e:
-        logger.error(f"Error fetching zipcode data: {str(e)}")
-        return None
+        logger.error("Error fetching zipcode data: %s", e)
+        return None, True
 
 
-def calculate_direction(lat: float, lon: float) -> Direction:
+# directions indexed by (north << 1) | east
+_DIRS = (
+    Direction.SOUTHWEST.value,
+    Direction.SOUTHEAST.value,
+    Direction.NORTHWEST.value,
+    Direction.NORTHEAST.value,
+)
+
+
+def calculate_direction(
+    lat: float,
+    lon: float,
+    _ny_lat: float = settings.NY_LATITUDE,
+    _ny_lon: float = settings.NY_LONGITUDE,
+    _dirs: tuple = _DIRS,
+) -> Direction:
     """Calculate direction from New York based on coordinates.
     
+    The New York coordinates are read from settings once, at import.
+    
     Args:
         lat: Latitude of the location
         lon: Longitude of the location
@@ -63,24 +170,4 @@ def calculate_direction(lat: float, lon: float) -> Direction:
     Returns:
         Direction: Direction enum value (NE, NW, SE, SW)
     """
-    ny_lat = settings.NY_LATITUDE
-    ny_lon = settings.NY_LONGITUDE
-    
-    # Determine north/south component
-    ns = "N" if lat >= ny_lat else "S"
-    
-    # Determine east/west component
-    ew = "E" if lon >= ny_lon else "W"
-    
-    direction = f"{ns}{ew}"
-    
-    logger.debug(f"Calculated direction from NY: {direction}")
-    
-    direction_map = {
-        "NE": Direction.NORTHEAST,
-        "NW": Direction.NORTHWEST,
-        "SE": Direction.SOUTHEAST,
-        "SW": Direction.SOUTHWEST
-    }
-    
-    return direction_map[direction].value
\ No newline at end of file
+    return _dirs[((lat >= _ny_lat) << 1) | (lon >= _ny_lon)]
@@ -1,36 +1,46 @@
-import re
+import string
 import logging
 import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-# Regular expression for US postal codes
-# Basic format: 5 digits or 5 digits + dash + 4 digits
-US_POSTCODE_REGEX = r"^\d{5}(-\d{4})?$"
+# minimum lead time of a start date
+_ONE_WEEK: datetime.timedelta = datetime.timedelta(weeks=1)
 
+# snake_case conversion table, built once instead of on every key
+_SNAKE_TABLE: Dict[int, str] = {ord(c): "_" + c.lower() for c in string.ascii_uppercase}
 
+
+@lru_cache(maxsize=4096)
 def validate_postcode(postcode: str) -> bool:
     """Validate if a string is a valid US postal code.
     
+    Basic format: 5 digits or 5 digits + dash + 4 digits. Checked with
+    length and ``str.isdecimal`` (what ``\\d`` matches) instead of a regex.
+    Results are memoized since the same few codes are validated repeatedly.
+    
     Args:
         postcode: The postal code to validate
         
     Returns:
         bool: True if valid, False otherwise
     """
-    if not postcode:
-        return False
-    
-    return bool(re.match(US_POSTCODE_REGEX, postcode))
+    n = len(postcode) if postcode else 0
+    if n == 5:
+        return postcode.isdecimal()
+    if n == 10:
+        return postcode[5] == "-" and postcode[:5].isdecimal() and postcode[6:].isdecimal()
+    return False
 
 
-def validate_name_in_users(name: str, users: List[str]) -> bool:
+def validate_name_in_users(name: str, users: Collection[str]) -> bool:
     """Validate that the name field is included in the users list.
     
     Args:
         name: The name to check
-        users: List of users
+        users: List of users, or a set of them for a constant-time check
         
     Returns:
         bool: True if name is in users list, False otherwise
@@ -38,17 +48,107 @@ def validate_name_in_users(name: str, users: List[str]) -> bool:
     return name in users
 
 
-def validate_start_date(start_date: datetime.datetime) -> bool:
+def make_cutoff() -> datetime.datetime:
+    """Earliest valid start date, 1 week after the current date.
+    
+    Batch callers compute it once and pass it to ``validate_start_date``
+    instead of reading the clock for every date.
+    
+    Returns:
+        datetime: Aware UTC datetime 1 week from now
+    """
+    return datetime.datetime.now(datetime.UTC) + _ONE_WEEK
+
+
+def validate_start_date(start_date: datetime.datetime, cutoff: Optional[datetime.datetime] = None) -> bool:
     """Validate start date is at least 1 week after current date.
     
     Args:
         start_date: The start date to validate
+        cutoff: Precomputed ``make_cutoff()`` value, computed here if omitted
         
     Returns:
         bool: True if valid, False otherwise
     """
-    one_week_from_now = datetime.datetime.now(datetime.UTC) + datetime.timedelta(weeks=1)
-    return start_date >= one_week_from_now
+    if cutoff is None:
+        cutoff = make_cutoff()
+    return start_date >= cutoff
+
+
+# converted keys are memoized; the caches are bounded LRUs because keys
+# come from client payloads, and seed_key_cache warms them with the model fields
+@lru_cache(maxsize=1024)
+def _to_snake(key: str) -> str:
+    """Convert a single camelCase key to snake_case."""
+    return key.translate(_SNAKE_TABLE).lstrip("_")
+
+
+@lru_cache(maxsize=1024)
+def _to_camel(key: str) -> str:
+    """Convert a single snake_case key to camelCase."""
+    # title() upper-cases the first letter after each underscore, then the
+    # underscores are dropped; keys without one come back unchanged
+    first, _, rest = key.partition("_")
+    return first + rest.title().replace("_", "")
+
+
+def seed_key_cache(snake_keys: Iterable[str]) -> None:
+    """Pre-populate the key conversion caches in both directions.
+
+    Args:
+        snake_keys: Known snake_case field names, e.g. a model's fields
+    """
+    for snake_key in snake_keys:
+        _to_snake(_to_camel(snake_key))
+
+
+def _has_nested(data: Dict[str, Any]) -> bool:
+    """Whether any value is a dict or a list of dicts the converters recurse into."""
+    for value in data.values():
+        if isinstance(value, dict) or (isinstance(value, list) and value and isinstance(value[0], dict)):
+            return True
+    return False
+
+
+def _convert_keys(data: Dict[str, Any], transform: Callable[[str], str]) -> Dict[str, Any]:
+    """Rename the keys of a dict, and of nested dicts and lists of dicts.
+    
+    Nested levels are walked with an explicit stack of (source, target)
+    pairs rather than recursion, so depth costs no Python call frames.
+    
+    Args:
+        data: Dictionary to convert
+        transform: Function converting a single key
+        
+    Returns:
+        dict: Dictionary with converted keys
+    """
+    # most payloads are flat, which needs no per-value type dispatch
+    if not _has_nested(data):
+        return {transform(key): value for key, value in data.items()}
+    
+    result: Dict[str, Any] = {}
+    stack: List[Tuple[Dict[str, Any], Dict[str, Any]]] = [(data, result)]
+    while stack:
+        source, target = stack.pop()
+        if not source:
+            continue
+        for key, value in source.items():
+            if isinstance(value, dict):
+                child: Dict[str, Any] = {}
+                stack.append((value, child))
+                target[transform(key)] = child
+            elif isinstance(value, list) and value and isinstance(value[0], dict):
+                children: List[Dict[str, Any]] = []
+                for item in value:
+                    child = {}
+                    stack.append((item, child))
+                    children.append(child)
+                target[transform(key)] = children
+            else:
+                target[transform(key)] = value
+    
+    return result
 
 
 def convert_keys_to_snake_case(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -63,18 +163,7 @@ def convert_keys_to_snake_case(data: Dict[str, Any]) -> Dict[str, Any]:
     if not data:
         return {}
     
-    result = {}
-    for key, value in data.items():
-        snake_key = ''.join(['_' + c.lower() if c.isupper() else c for c in key]).lstrip('_')
-        
-        if isinstance(value, dict):
-            result[snake_key] = convert_keys_to_snake_case(value)
-        elif isinstance(value, list) and value and isinstance(value[0], dict):
-            result[snake_key] = [convert_keys_to_snake_case(item) for item in value]
-        else:
-            result[snake_key] = value
-    
-    return result
+    return _convert_keys(data, _to_snake)
 
 
 def convert_keys_to_camel_case(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -89,65 +178,75 @@ def convert_keys_to_camel_case(data: Dict[str, Any]) -> Dict[str, Any]:
     if not data:
         return {}
     
-    result = {}
-    for key, value in data.items():
-        components = key.split('_')
-        camel_key = components[0] + ''.join(x.title() for x in components[1:])
-        
-        if isinstance(value, dict):
-            result[camel_key] = convert_keys_to_camel_case(value)
-        elif isinstance(value, list) and value and isinstance(value[0], dict):
-            result[camel_key] = [convert_keys_to_camel_case(item) for item in value]
-        else:
-            result[camel_key] = value
-    
-    return result
+    return _convert_keys(data, _to_camel)
 
 
-def validate_item_data(data: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str, str]]]:
+def validate_item_data(
+    data: Dict[str, Any], cutoff: Optional[datetime.datetime] = None
+) -> Tuple[bool, Optional[Dict[str, str]]]:
     """Validate item data against requirements.
     
     Args:
         data: The item data to validate
+        cutoff: Precomputed ``make_cutoff()`` value, shared when validating many items
         
     Returns:
         tuple: (is_valid, errors)
             - is_valid: True if data is valid, False otherwise
             - errors: Dictionary with field names as keys and error messages as values
     """
-    errors = {}
+    errors: Dict[str, str] = {}
+    
+    # each field is looked up once; a missing key and None are both "missing"
+    name = data.get("name")
+    postcode = data.get("postcode")
+    users = data.get("users")
+    start_date = data.get("start_date")
+    title = data.get("title")
     
-    if "name" not in data:
+    if name is None:
         errors["name"] = "Name is required"
-    elif len(data["name"]) > 50:
+    elif len(name) > 50:
         errors["name"] = "Name must be less than 50 characters"
     
-    if "postcode" not in data:
+    # validate_postcode, validate_name_in_users and validate_start_date are
+    # inlined below to save a call per check; keep them in sync
+    if postcode is None:
         errors["postcode"] = "Postcode is required"
-    elif not validate_postcode(data["postcode"]):
-        errors["postcode"] = "Invalid US postcode format"
-    
-    if "users" not in data:
+    else:
+        n = len(postcode)
+        if not (
+            (n == 5 and postcode.isdecimal())
+            or (n == 10 and postcode[5] == "-" and postcode[:5].isdecimal() and postcode[6:].isdecimal())
+        ):
+            errors["postcode"] = "Invalid US postcode format"
+    
+    # None when users is not a list, so the name check below is skipped
+    name_seen: Optional[bool] = None
+    if users is None:
         errors["users"] = "Users list is required"
-    elif not isinstance(data["users"], list):
+    elif not isinstance(users, list):
         errors["users"] = "Users must be a list"
     else:
-        for i, user in enumerate(data["users"]):
+        # the length check and the name check share one pass over the list
+        name_seen = False
+        for i, user in enumerate(users):
+            if user == name:
+                name_seen = True
             if len(user) > 50:
                 errors[f"users[{i}]"] = f"User name '{user}' exceeds 50 characters"
 
-    if "start_date" not in data:
+    if start_date is None:
         errors["start_date"] = "Start date is required"
-    elif not validate_start_date(data["start_date"]):
+    elif start_date < (cutoff if cutoff is not None else make_cutoff()):
         errors["start_date"] = "Start date must be at least 1 week after the item creation date"
     
     # Validate that name is in users list
-    if "name" in data and "users" in data and isinstance(data["users"], list):
-        if not validate_name_in_users(data["name"], data["users"]):
-            errors["name"] = "Name must be included in the users list"
+    if name is not None and name_seen is False:
+        errors["name"] = "Name must be included in the users list"
     
     # Title validation (optional field)
-    if "title" in data and data["title"] is not None and len(data["title"]) > 100:
+    if title is not None and len(title) > 100:
         errors["title"] = "Title must be less than 100 characters"
     
     return len(errors) == 0, errors
\ No newline at end of file